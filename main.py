@@ -4,12 +4,15 @@ from tkcalendar import DateEntry
 from datetime import date, datetime
 import re
 import logging
+import queue
+import threading
 from contextlib import contextmanager
-from typing import Optional, Set
+from functools import partial
+from typing import Optional
 
 # SQLAlchemy imports
-from sqlalchemy import create_engine, Column, Integer, String, Date, Float, ForeignKey, Index
-from sqlalchemy.orm import declarative_base, sessionmaker, relationship, joinedload
+from sqlalchemy import bindparam, create_engine, event, select, text, update, Column, Computed, Integer, String, Date, Float, ForeignKey, Index
+from sqlalchemy.orm import declarative_base, sessionmaker, scoped_session, relationship, joinedload, raiseload
 
 # ------------------------
 # Logging Configuration
@@ -25,15 +28,54 @@ logging.basicConfig(
 # ------------------------
 Base = declarative_base()
 
+# SQLite expression for the generated search_blob column below; shared with
+# the migration in _migrate_schema so both stay in sync.
+_SEARCH_BLOB_SQL = (
+    "patient_name || ' ' || phone_number || ' ' || coalesce(treatment_type, '')"
+)
+
+# Teeth are stored as a 32-bit mask (4 quadrants x 8 teeth): UL1..UL8 occupy
+# bits 0..7, then UR, LL, LR. Selection tests, comparison, and storage become
+# single-word operations instead of string splitting and joining.
+_TOOTH_BIT = {
+    f"{qabbr}{num}": base * 8 + num - 1
+    for base, qabbr in enumerate(("UL", "UR", "LL", "LR"))
+    for num in range(1, 9)
+}
+
+def teeth_to_bits(selection: str) -> int:
+    """Converts a comma-separated tooth list (e.g. 'LL3, UR7') to a bitmask."""
+    bits = 0
+    for tooth in selection.split(","):
+        tooth = tooth.strip()
+        if tooth in _TOOTH_BIT:
+            bits |= 1 << _TOOTH_BIT[tooth]
+    return bits
+
+def bits_to_teeth(bits: int) -> str:
+    """Formats a tooth bitmask as the sorted, comma-separated display string."""
+    return ", ".join(sorted(name for name, pos in _TOOTH_BIT.items() if bits & (1 << pos)))
+
 class Patient(Base):
     __tablename__ = 'patients'
     id = Column(Integer, primary_key=True)
     patient_name = Column(String, nullable=False)
     phone_number = Column(String, unique=True, nullable=False)
     treatment_type = Column(String, nullable=True)
-    teeth_location = Column(String, nullable=True)
-    # One patient can have multiple appointments
-    appointments = relationship("Appointment", back_populates="patient", cascade="all, delete-orphan")
+    teeth_bits = Column(Integer, nullable=False, default=0)
+    # Concatenation of the searchable text fields, generated by SQLite.
+    # Lets the fallback search run one LIKE instead of several ORed ones.
+    search_blob = Column(String, Computed(_SEARCH_BLOB_SQL, persisted=False))
+    # One patient can have multiple appointments; the collection arrives
+    # pre-sorted by SQLite (via idx_app_patient_date) in one IN query
+    # rather than being lazily loaded and sorted in Python.
+    appointments = relationship(
+        "Appointment",
+        back_populates="patient",
+        cascade="all, delete-orphan",
+        order_by="Appointment.appointment_date",
+        lazy="selectin",
+    )
 
     def __repr__(self) -> str:
         return f"<Patient(name='{self.patient_name}', phone='{self.phone_number}')>"
@@ -54,11 +96,169 @@ class Appointment(Base):
 
 # Index for faster phone lookup
 Index('idx_phone', Patient.phone_number)
+# Index for the today's-appointments filter used by the periodic refresh
+# and the reminders dialog
+Index('idx_app_date', Appointment.appointment_date)
+# Covering index for the patients-to-appointments join ordered by date
+# used when listing records
+Index('idx_app_patient_date', Appointment.patient_id, Appointment.appointment_date)
+# Case-insensitive index over the generated search text
+Index('idx_search_blob_nocase', Patient.search_blob.collate('NOCASE'))
+
+# Built once at import so the 60-second refresh and the reminders dialog
+# reuse the compiled statement instead of recompiling it per call; the
+# date is bound at execution time.
+TODAY_APPTS_STMT = (
+    select(Appointment)
+    .options(joinedload(Appointment.patient), raiseload('*'))
+    .where(Appointment.appointment_date == bindparam('d'))
+)
+
+# check_same_thread is disabled so the background database worker thread
+# can use connections; sessions themselves are never shared across threads.
+engine = create_engine(
+    'sqlite:///dentistry_clinic.db',
+    echo=False,
+    connect_args={"check_same_thread": False}
+)
 
-engine = create_engine('sqlite:///dentistry_clinic.db', echo=False)
-Session = sessionmaker(bind=engine)
+@event.listens_for(engine, "connect")
+def _configure_sqlite(dbapi_connection, connection_record) -> None:
+    """Per-connection SQLite tuning."""
+    cursor = dbapi_connection.cursor()
+    # WAL lets readers proceed during writes and roughly halves commit
+    # latency; NORMAL syncing is durable enough under WAL for this app.
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    # Let SQLite refresh its query-planner statistics for the indexes above.
+    cursor.execute("PRAGMA optimize")
+    cursor.close()
+# scoped_session keeps a per-thread session registry, so repeated GUI
+# actions (and the worker thread) reuse connection state instead of
+# constructing a fresh Session for every one-row lookup.
+_session_factory = sessionmaker(bind=engine)
+Session = scoped_session(_session_factory)
 Base.metadata.create_all(engine)
 
+def _migrate_schema() -> None:
+    """
+    Brings pre-existing databases up to date with the declared schema.
+    create_all only creates missing tables, so columns and indexes added
+    after a database was first created are applied here idempotently.
+    """
+    with engine.begin() as conn:
+        # table_xinfo, unlike table_info, also lists generated columns.
+        patient_columns = [row[1] for row in conn.exec_driver_sql("PRAGMA table_xinfo(patients)")]
+        if 'teeth_bits' not in patient_columns:
+            conn.exec_driver_sql(
+                "ALTER TABLE patients ADD COLUMN teeth_bits INTEGER NOT NULL DEFAULT 0"
+            )
+            # One-shot backfill from the old comma-separated string column,
+            # which stays in place (generated columns may reference it) but
+            # is no longer read or written.
+            if 'teeth_location' in patient_columns:
+                legacy = conn.exec_driver_sql(
+                    "SELECT id, teeth_location FROM patients "
+                    "WHERE teeth_location IS NOT NULL AND teeth_location != ''"
+                ).fetchall()
+                for patient_id, teeth in legacy:
+                    conn.exec_driver_sql(
+                        "UPDATE patients SET teeth_bits = ? WHERE id = ?",
+                        (teeth_to_bits(teeth), patient_id),
+                    )
+        if 'search_blob' not in patient_columns:
+            conn.exec_driver_sql(
+                f"ALTER TABLE patients ADD COLUMN search_blob TEXT "
+                f"GENERATED ALWAYS AS ({_SEARCH_BLOB_SQL}) VIRTUAL"
+            )
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS idx_app_date ON appointments (appointment_date)"
+        )
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS idx_app_patient_date ON appointments (patient_id, appointment_date)"
+        )
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS idx_search_blob_nocase ON patients (search_blob COLLATE NOCASE)"
+        )
+
+_migrate_schema()
+
+# ------------------------
+# Full-Text Search Index
+# ------------------------
+# Searching used to OR five leading-wildcard LIKEs, forcing a scan of every
+# patient and appointment per query. An FTS5 index over the searchable text
+# answers the same lookups in O(matches); rowid mirrors patients.id.
+_FTS_SOURCE_SQL = (
+    "SELECT p.id, p.patient_name, p.phone_number, coalesce(p.treatment_type, ''), "
+    "coalesce(p.teeth_bits, 0), "
+    "coalesce((SELECT group_concat(a.treatment_type, ' ') FROM appointments a "
+    "WHERE a.patient_id = p.id), '') "
+    "FROM patients p"
+)
+
+def _fts_index_rows(conn, source_rows) -> None:
+    """Writes patient_fts rows; the teeth mask is rendered as its tooth names."""
+    for pid, name, phone, treatment, teeth_bits, app_treatments in source_rows:
+        conn.exec_driver_sql(
+            "INSERT INTO patient_fts(rowid, patient_name, phone_number, "
+            "treatment_type, teeth_location, appointment_treatments) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (pid, name, phone, treatment, bits_to_teeth(teeth_bits), app_treatments),
+        )
+
+def _init_patient_fts() -> bool:
+    """Creates and repopulates the patient_fts index; False if FTS5 is unavailable."""
+    try:
+        with engine.begin() as conn:
+            conn.exec_driver_sql(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS patient_fts USING fts5("
+                "patient_name, phone_number, treatment_type, teeth_location, "
+                "appointment_treatments, tokenize='unicode61')"
+            )
+            conn.exec_driver_sql("DELETE FROM patient_fts")
+            _fts_index_rows(conn, conn.exec_driver_sql(_FTS_SOURCE_SQL).fetchall())
+        return True
+    except Exception:
+        logging.warning("FTS5 unavailable; search will fall back to LIKE scans")
+        return False
+
+FTS_ENABLED = _init_patient_fts()
+
+@event.listens_for(_session_factory, "after_flush")
+def _sync_patient_fts(session, flush_context) -> None:
+    """Re-indexes the FTS rows of patients touched by a flush."""
+    if not FTS_ENABLED:
+        return
+    patient_ids = set()
+    for obj in session.new:
+        patient_ids.add(obj.id if isinstance(obj, Patient) else obj.patient_id)
+    for obj in session.dirty:
+        patient_ids.add(obj.id if isinstance(obj, Patient) else obj.patient_id)
+    for obj in session.deleted:
+        patient_ids.add(obj.id if isinstance(obj, Patient) else obj.patient_id)
+    patient_ids.discard(None)
+    _reindex_patient_fts(session.connection(), patient_ids)
+
+def _reindex_patient_fts(conn, patient_ids) -> None:
+    """
+    Rewrites the FTS rows for the given patient ids. Called from the flush
+    hook above and directly by Core-statement write paths, which bypass ORM
+    flush events.
+    """
+    if not FTS_ENABLED:
+        return
+    for pid in patient_ids:
+        conn.exec_driver_sql("DELETE FROM patient_fts WHERE rowid = ?", (pid,))
+        # The source select yields no row for a deleted patient.
+        source = conn.exec_driver_sql(_FTS_SOURCE_SQL + " WHERE p.id = ?", (pid,)).fetchall()
+        _fts_index_rows(conn, source)
+
+def _fts_match_expression(query: str) -> str:
+    """Builds a safe FTS5 MATCH expression: quoted prefix tokens, ANDed."""
+    tokens = [token.replace('"', '""') for token in query.split()]
+    return " ".join(f'"{token}"*' for token in tokens)
+
 @contextmanager
 def session_scope():
     """Provide a transactional scope for database operations."""
@@ -71,21 +271,39 @@ def session_scope():
         logging.error("Session rollback because of exception: %s", e)
         raise
     finally:
-        session.close()
+        Session.remove()
 
 # ------------------------
 # Utility Functions
 # ------------------------
+# Compiled once at import; fullmatch makes the ^/$ anchors unnecessary.
+_PHONE_RE = re.compile(r'\+?\d{8,15}')
+
 def validate_phone(phone: str) -> Optional[str]:
     """
     Validate phone number using a regex.
     Accepts an optional '+' at the beginning and 8 to 15 digits.
     """
-    pattern = r'^\+?\d{8,15}$'
-    if re.match(pattern, phone):
+    if _PHONE_RE.fullmatch(phone):
         return phone
     return None
 
+# Row-formatting helpers for the record listing, bound once so the per-row
+# loop avoids conditional f-strings; date.isoformat (C-implemented) replaces
+# strftime and skips its format-spec parsing.
+_EMPTY = ""
+_format_fee = "%.2f".__mod__
+
+# Quadrant layout for the teeth selector: (label, abbreviation, tooth numbers
+# in display order). Left quadrants count down 8..1, right quadrants 1..8 so
+# the rows read like a dental chart.
+_QUADRANT_LAYOUT = (
+    ("Upper Left", "UL", tuple(range(8, 0, -1))),
+    ("Upper Right", "UR", tuple(range(1, 9))),
+    ("Lower Left", "LL", tuple(range(8, 0, -1))),
+    ("Lower Right", "LR", tuple(range(1, 9))),
+)
+
 def validate_fee(fee: str) -> Optional[float]:
     try:
         f = float(fee)
@@ -99,8 +317,40 @@ def validate_fee(fee: str) -> Optional[float]:
 # Dentistry Clinic Application Class
 # ------------------------
 class DentistryClinicApp(tk.Tk):
+    # Number of rows fetched per page when populating the treeview.
+    PAGE_SIZE = 200
+
     def __init__(self) -> None:
         super().__init__()
+        # Incremental-load state: only the visible window of records is
+        # fetched up front; further pages load as the user scrolls.
+        self._active_query: Optional[str] = None
+        self._page_offset = 0
+        self._more_rows = True
+        self._loading_page = False
+        # Bumped whenever the view is reset so stale background results
+        # arriving afterwards are discarded.
+        self._view_generation = 0
+        # Bumped on every mutation; the periodic refresh skips re-querying
+        # when the (query, version) it last rendered is still current.
+        self._cache_version = 0
+        self._rendered_state = None
+        # Diff state for refreshes: row key -> treeview iid, plus the last
+        # rendered (key, values) list so unchanged refreshes cost nothing.
+        self._row_index = {}
+        self._row_snapshot = []
+        # Teeth-selector state, shared by _toggle_tooth. The per-tooth
+        # commands are built once here instead of 32 closures per open.
+        self._teeth_buttons = {}
+        self._teeth_bits = 0
+        self._tooth_commands = {
+            f"{qabbr}{num}": partial(self._toggle_tooth, f"{qabbr}{num}")
+            for _, qabbr, numbers in _QUADRANT_LAYOUT for num in numbers
+        }
+        # All queries run on this worker thread; results are marshalled back
+        # to the Tk main loop with self.after so the UI never blocks on I/O.
+        self._db_queue: queue.Queue = queue.Queue()
+        threading.Thread(target=self._db_worker_loop, daemon=True).start()
         self.title("🦷 Dentistry Clinic Management System")
         self.geometry("1000x650")
         self.configure(bg="#f4f6f8")
@@ -110,6 +360,9 @@ class DentistryClinicApp(tk.Tk):
         self.style.configure("TButton", font=("Segoe UI", 10), padding=5)
         self.style.configure("Treeview.Heading", font=("Segoe UI", 10, "bold"), background="#007acc", foreground="white")
         self.style.configure("Treeview", font=("Segoe UI", 10), rowheight=25)
+        self._refresh_after_id = None
+        self._search_after_id = None
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         self.create_widgets()
         self.show_records()  # Initial load of records
         self.auto_refresh()   # Start auto-refresh
@@ -147,7 +400,8 @@ class DentistryClinicApp(tk.Tk):
         ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT, padx=5)
         self.search_entry = tk.Entry(search_frame)
         self.search_entry.pack(side=tk.LEFT, padx=5)
-        ttk.Button(search_frame, text="Go", command=self.search_records).pack(side=tk.LEFT, padx=5)
+        # Reactive search: debounced so it fires once typing pauses.
+        self.search_entry.bind('<KeyRelease>', self._on_search_key)
 
         # Records Treeview with Scrollbar
         tree_frame = tk.Frame(self)
@@ -161,10 +415,10 @@ class DentistryClinicApp(tk.Tk):
         for col in columns:
             self.tree.heading(col, text=col)
             self.tree.column(col, width=120, anchor="center")
-        vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=vsb.set)
+        self._vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self._on_tree_scroll)
         self.tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
+        self._vsb.grid(row=0, column=1, sticky="ns")
         tree_frame.grid_rowconfigure(0, weight=1)
         tree_frame.grid_columnconfigure(0, weight=1)
 
@@ -172,77 +426,272 @@ class DentistryClinicApp(tk.Tk):
         """Clears all entries from the treeview."""
         for item in self.tree.get_children():
             self.tree.delete(item)
+        self._row_index.clear()
+        self._row_snapshot = []
+
+    @contextmanager
+    def _suspend_tree_redraw(self):
+        """
+        Suppresses per-insert layout and scroll work during bulk treeview
+        inserts: with no display columns and no scroll callback, Tk does not
+        recompute the layout for every inserted row. The tree repaints once
+        when the configuration is restored.
+        """
+        self.tree.configure(displaycolumns=(), yscrollcommand='')
+        try:
+            yield
+        finally:
+            self.tree.configure(displaycolumns='#all', yscrollcommand=self._on_tree_scroll)
+
+    def _db_worker_loop(self) -> None:
+        """Runs queued database jobs and posts results back to the Tk loop."""
+        while True:
+            job, callback, on_error = self._db_queue.get()
+            try:
+                result = job()
+            except Exception as e:
+                logging.exception("Background database job failed")
+                if on_error is not None:
+                    self.after(0, on_error, e)
+            else:
+                self.after(0, callback, result)
+
+    def _submit_db_job(self, job, callback, on_error=None) -> None:
+        """
+        Queues `job` for the worker thread; `callback(result)` runs on the
+        main thread. If the job raises, `on_error(exception)` runs on the
+        main thread instead, so callers can reset in-flight state and
+        surface the failure to the user.
+        """
+        self._db_queue.put((job, callback, on_error))
 
     def show_records(self, query: Optional[str] = None) -> None:
         """
         Displays patient and appointment records in the treeview.
-        
+
+        Only the first page is loaded eagerly; subsequent pages load lazily
+        as the user scrolls (see _on_tree_scroll), so refresh cost stays
+        flat regardless of how large the clinic database grows.
+
         Args:
             query: Optional search term to filter records.
         """
         self.clear_tree()
+        self._active_query = query
+        self._page_offset = 0
+        self._more_rows = True
+        self._view_generation += 1
+        self._load_next_page()
+
+    @staticmethod
+    def _fetch_rows(query: Optional[str], limit: int, offset: int = 0):
+        """
+        Runs on the worker thread: fetches a window of records as a flat
+        column projection and returns display-ready (row_key, values) pairs.
+
+        Selecting columns instead of entities skips ORM instantiation of
+        Patient/Appointment objects, and the outer join with SQL-side
+        ordering replaces the per-patient Python sort.
+        """
         with session_scope() as session:
-            q = session.query(Patient)
-            if query:
-                q = q.filter(
-                    (Patient.patient_name.ilike(f"%{query}%")) |
-                    (Patient.phone_number.ilike(f"%{query}%")) |
-                    (Patient.treatment_type.ilike(f"%{query}%")) |
-                    (Patient.teeth_location.ilike(f"%{query}%")) |
-                    (Patient.appointments.any(Appointment.treatment_type.ilike(f"%{query}%")))
+            q = (
+                session.query(
+                    Patient.id,
+                    Appointment.id,
+                    Patient.patient_name,
+                    Patient.phone_number,
+                    Patient.treatment_type,
+                    Patient.teeth_bits,
+                    Appointment.appointment_date,
+                    Appointment.treatment_type,
+                    Appointment.dentist,
+                    Appointment.fee,
+                    Appointment.notes,
                 )
-            patients = q.all()
-            for patient in patients:
-                if patient.appointments:
-                    appointments_sorted = sorted(patient.appointments, key=lambda a: a.appointment_date)
-                    for app in appointments_sorted:
-                        self.tree.insert("", "end", values=(
-                            patient.patient_name,
-                            patient.phone_number,
-                            patient.treatment_type if patient.treatment_type else "",
-                            patient.teeth_location if patient.teeth_location else "",
-                            app.appointment_date.strftime("%Y-%m-%d"),
-                            app.treatment_type,
-                            app.dentist,
-                            f"{app.fee:.2f}" if app.fee is not None else "",
-                            app.notes if app.notes else ""
-                        ))
+                .outerjoin(Appointment)
+            )
+            if query:
+                match = FTS_ENABLED and _fts_match_expression(query)
+                if match:
+                    matched_ids = [
+                        row[0] for row in session.execute(
+                            text("SELECT rowid FROM patient_fts WHERE patient_fts MATCH :q"),
+                            {"q": match}
+                        )
+                    ]
+                    q = q.filter(Patient.id.in_(matched_ids))
                 else:
-                    self.tree.insert("", "end", values=(
-                        patient.patient_name,
-                        patient.phone_number,
-                        patient.treatment_type if patient.treatment_type else "",
-                        patient.teeth_location if patient.teeth_location else "",
-                        "", "", "", "", ""
-                    ))
+                    # One LIKE over the generated search text instead of
+                    # four ORed LIKEs plus an EXISTS subquery.
+                    q = q.filter(Patient.search_blob.ilike(f"%{query}%"))
+            # The display-tuple list below is O(window) either way; yield_per
+            # just avoids additionally buffering the whole window of raw Row
+            # objects before the comprehension consumes them.
+            q = (
+                q.order_by(Patient.id, Appointment.appointment_date)
+                .limit(limit)
+                .offset(offset)
+                .yield_per(DentistryClinicApp.PAGE_SIZE)
+            )
+            return [
+                ((pid, aid), (
+                    name,
+                    phone,
+                    p_treatment or _EMPTY,
+                    bits_to_teeth(teeth) if teeth else _EMPTY,
+                    app_date.isoformat() if app_date else _EMPTY,
+                    a_treatment or _EMPTY,
+                    dentist or _EMPTY,
+                    _format_fee(fee) if fee is not None else _EMPTY,
+                    notes or _EMPTY
+                ))
+                for pid, aid, name, phone, p_treatment, teeth,
+                    app_date, a_treatment, dentist, fee, notes in q
+            ]
+
+    def _load_next_page(self) -> None:
+        """Queues a fetch of the next page of patients."""
+        if self._loading_page or not self._more_rows:
+            return
+        self._loading_page = True
+        generation = self._view_generation
+        state = (self._active_query, self._cache_version)
+        query, offset = self._active_query, self._page_offset
+        self._submit_db_job(
+            lambda: self._fetch_rows(query, self.PAGE_SIZE, offset),
+            lambda result: self._append_page(generation, state, result),
+            on_error=self._abort_page_load
+        )
+
+    def _abort_page_load(self, exc: Exception) -> None:
+        """Clears the in-flight flag so a failed page fetch can be retried."""
+        self._loading_page = False
+
+    def _append_page(self, generation: int, state, rows) -> None:
+        """Main-thread continuation of _load_next_page."""
+        self._loading_page = False
+        if generation != self._view_generation:
+            return  # View was reset while the fetch was in flight.
+        self._page_offset += len(rows)
+        self._more_rows = len(rows) == self.PAGE_SIZE
+        self._rendered_state = state
+        with self._suspend_tree_redraw():
+            for key, values in rows:
+                self._row_index[key] = self.tree.insert("", "end", values=values)
+                self._row_snapshot.append((key, values))
+
+    def _refresh_loaded_rows(self) -> None:
+        """Queues a re-fetch of the currently loaded window for diffing."""
+        if (self._active_query, self._cache_version) == self._rendered_state:
+            return  # Nothing has changed since the last render.
+        generation = self._view_generation
+        state = (self._active_query, self._cache_version)
+        query = self._active_query
+        limit = max(self._page_offset, self.PAGE_SIZE)
+        self._submit_db_job(
+            lambda: self._fetch_rows(query, limit),
+            lambda rows: self._apply_refresh(generation, state, limit, rows)
+        )
+
+    def _apply_refresh(self, generation: int, state, limit: int, rows) -> None:
+        """
+        Applies a refreshed window to the treeview as a diff, so an idle
+        refresh costs O(changes) widget calls instead of a full
+        clear-and-reinsert.
+        """
+        if generation != self._view_generation:
+            return
+        self._page_offset = len(rows)
+        self._more_rows = len(rows) == limit
+        self._rendered_state = state
+        if rows == self._row_snapshot:
+            return
+        previous = dict(self._row_snapshot)
+        new_keys = {key for key, _ in rows}
+        with self._suspend_tree_redraw():
+            # Removed rows go first: insert positions below are indexes into
+            # the new row list, which only line up with the tree once stale
+            # rows no longer shift the surviving ones.
+            for key in [k for k in self._row_index if k not in new_keys]:
+                self.tree.delete(self._row_index.pop(key))
+            for pos, (key, values) in enumerate(rows):
+                iid = self._row_index.get(key)
+                if iid is None:
+                    # Surviving rows keep their relative order, so inserting
+                    # new rows at their final position needs no moves.
+                    self._row_index[key] = self.tree.insert("", pos, values=values)
+                elif previous.get(key) != values:
+                    self.tree.item(iid, values=values)
+        self._row_snapshot = rows
+
+    def _on_tree_scroll(self, first: str, last: str) -> None:
+        """Scrollbar proxy that lazily loads the next page near the bottom."""
+        self._vsb.set(first, last)
+        if self._more_rows and float(last) > 0.9:
+            self._load_next_page()
 
     def auto_refresh(self) -> None:
         """
         Automatically refreshes records and checks for today's appointments.
-        Schedules itself to run every 60 seconds.
+        Schedules itself to run every 60 seconds. While the window is
+        minimized the tick only reschedules itself; queries and repaints
+        resume once the window is visible again.
         """
-        self.show_records()
-        with session_scope() as session:
-            today_date = date.today()
-            apps_today = session.query(Appointment).filter(Appointment.appointment_date == today_date).all()
-            if apps_today:
-                logging.info("There are %d appointment(s) scheduled for today.", len(apps_today))
-        self.after(60000, self.auto_refresh)  # Refresh every 60 seconds
-
-    def open_teeth_selector(self, parent: tk.Toplevel, initial_selection: str, callback) -> None:
+        # Only skip while hidden; a maximized window reports 'zoomed' on
+        # Windows and must keep refreshing.
+        if self.state() in ('iconic', 'withdrawn'):
+            self._refresh_after_id = self.after(60000, self.auto_refresh)
+            return
+        self._refresh_loaded_rows()
+
+        def count_today() -> int:
+            with session_scope() as session:
+                return len(session.execute(TODAY_APPTS_STMT, {'d': date.today()}).scalars().all())
+
+        def report(count: int) -> None:
+            if count:
+                logging.info("There are %d appointment(s) scheduled for today.", count)
+
+        self._submit_db_job(count_today, report)
+        self._refresh_after_id = self.after(60000, self.auto_refresh)  # Refresh every 60 seconds
+
+    def _on_close(self) -> None:
+        """Cancels the pending refresh timer and closes the application."""
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+        self.destroy()
+
+    def _toggle_tooth(self, tooth_id: str) -> None:
+        """Toggles one tooth button in the currently open teeth selector."""
+        bit = 1 << _TOOTH_BIT[tooth_id]
+        self._teeth_bits ^= bit
+        btn = self._teeth_buttons[tooth_id]
+        if self._teeth_bits & bit:
+            btn.config(relief="sunken", bg="lightblue")
+        else:
+            btn.config(relief="raised", bg="SystemButtonFace")
+
+    def open_teeth_selector(self, parent: tk.Toplevel, initial_bits: int, callback) -> None:
         """
         Opens a teeth selection window arranged in four quadrants:
           - Upper Left and Upper Right in the upper section.
           - Lower Left and Lower Right in the lower section.
-        Each quadrant displays its tooth numbers in a 1x8 grid.
-          - For left-side quadrants ("Upper Left" and "Lower Left"), the numbers are arranged descending (8 to 1).
-          - For right-side quadrants ("Upper Right" and "Lower Right"), the numbers are arranged ascending (1 to 8).
-        A prefix is added to each number to differentiate quadrants:
-          - Upper Left -> UL, Upper Right -> UR, Lower Left -> LL, Lower Right -> LR.
-        Clicking a tooth toggles its selection. On OK, a comma-separated string is returned.
+        Each quadrant displays its tooth numbers in a 1x8 grid laid out per
+        _QUADRANT_LAYOUT, with a quadrant prefix distinguishing the buttons
+        (e.g. Upper Left -> UL). Button commands come from the per-tooth
+        table built in __init__ rather than fresh closures per open.
+        Clicking a tooth toggles its bit in the selection mask. On OK, the
+        resulting bitmask is passed to `callback`.
+
+        The window is modal: the per-tooth commands share the instance-level
+        selection state, so two live selectors (opened from the non-modal
+        Add and Modify windows) would toggle each other's masks and buttons.
         """
         selector = tk.Toplevel(parent)
         selector.title("Select Teeth")
+        selector.transient(parent)
+        selector.wait_visibility()
+        selector.grab_set()  # Released automatically when the window is destroyed.
 
         # Main container frame
         main_frame = tk.Frame(selector)
@@ -254,60 +703,21 @@ class DentistryClinicApp(tk.Tk):
         lower_frame = tk.Frame(main_frame)
         lower_frame.pack(side=tk.TOP, pady=5)
 
-        # In the upper section, pack Upper Left first then Upper Right
-        upper_left_frame = tk.LabelFrame(upper_frame, text="Upper Left")
-        upper_left_frame.pack(side=tk.LEFT, padx=5)
-        upper_right_frame = tk.LabelFrame(upper_frame, text="Upper Right")
-        upper_right_frame.pack(side=tk.LEFT, padx=5)
-
-        # In the lower section, pack Lower Left then Lower Right
-        lower_left_frame = tk.LabelFrame(lower_frame, text="Lower Left")
-        lower_left_frame.pack(side=tk.LEFT, padx=5)
-        lower_right_frame = tk.LabelFrame(lower_frame, text="Lower Right")
-        lower_right_frame.pack(side=tk.LEFT, padx=5)
-
-        # Define quadrants with their abbreviations and associated frames
-        quadrant_info = {
-            "Upper Left": ("UL", upper_left_frame),
-            "Upper Right": ("UR", upper_right_frame),
-            "Lower Left": ("LL", lower_left_frame),
-            "Lower Right": ("LR", lower_right_frame)
-        }
-
-        # Initialize selection set; selections are stored with quadrant prefix (e.g. "UL3")
-        selected_teeth: Set[str] = set()
-        if initial_selection:
-            for tooth in initial_selection.split(","):
-                tooth = tooth.strip()
-                if tooth:
-                    selected_teeth.add(tooth)
-
-        buttons = {}
-
-        def toggle_tooth(qabbr: str, num: int) -> None:
-            tooth_id = f"{qabbr}{num}"
-            btn = buttons[tooth_id]
-            if tooth_id in selected_teeth:
-                selected_teeth.remove(tooth_id)
-                btn.config(relief="raised", bg="SystemButtonFace")
-            else:
-                selected_teeth.add(tooth_id)
-                btn.config(relief="sunken", bg="lightblue")
+        # Working copy of the selection mask for this open
+        self._teeth_bits = initial_bits
+        self._teeth_buttons = {}
 
         # Create a 1x8 grid of buttons for each quadrant
-        for qname, (qabbr, frame) in quadrant_info.items():
-            # For left-side quadrants, arrange numbers descending from 8 to 1;
-            # for right-side quadrants, arrange numbers ascending from 1 to 8.
-            if "Left" in qname:
-                numbers = list(reversed(range(1, 9)))
-            else:
-                numbers = list(range(1, 9))
+        for qname, qabbr, numbers in _QUADRANT_LAYOUT:
+            section = upper_frame if qname.startswith("Upper") else lower_frame
+            frame = tk.LabelFrame(section, text=qname)
+            frame.pack(side=tk.LEFT, padx=5)
             for col, i in enumerate(numbers):
                 tooth_id = f"{qabbr}{i}"
-                btn = tk.Button(frame, text=str(i), width=4, command=lambda qa=qabbr, num=i: toggle_tooth(qa, num))
+                btn = tk.Button(frame, text=str(i), width=4, command=self._tooth_commands[tooth_id])
                 btn.grid(row=0, column=col, padx=2, pady=2)
-                buttons[tooth_id] = btn
-                if tooth_id in selected_teeth:
+                self._teeth_buttons[tooth_id] = btn
+                if initial_bits & (1 << _TOOTH_BIT[tooth_id]):
                     btn.config(relief="sunken", bg="lightblue")
 
         # OK and Cancel buttons
@@ -315,8 +725,7 @@ class DentistryClinicApp(tk.Tk):
         action_frame.pack(pady=10)
 
         def on_ok() -> None:
-            selection = ", ".join(sorted(selected_teeth))
-            callback(selection)
+            callback(self._teeth_bits)
             selector.destroy()
 
         def on_cancel() -> None:
@@ -337,7 +746,7 @@ class DentistryClinicApp(tk.Tk):
                 if not phone:
                     raise ValueError("Invalid phone number.")
                 patient_treatment = patient_treatment_entry.get().strip()
-                teeth_location = teeth_var.get()  # from teeth selector
+                teeth_bits = teeth_bits_var.get()  # from teeth selector
 
                 # Appointment Info
                 app_date = date_picker.get_date()
@@ -358,14 +767,14 @@ class DentistryClinicApp(tk.Tk):
                             patient_name=name,
                             phone_number=phone,
                             treatment_type=patient_treatment,
-                            teeth_location=teeth_location
+                            teeth_bits=teeth_bits
                         )
                         session.add(patient)
                     else:
                         # Update patient details if desired
                         patient.patient_name = name
                         patient.treatment_type = patient_treatment
-                        patient.teeth_location = teeth_location
+                        patient.teeth_bits = teeth_bits
 
                     new_app = Appointment(
                         appointment_date=app_date,
@@ -376,6 +785,7 @@ class DentistryClinicApp(tk.Tk):
                         patient=patient
                     )
                     session.add(new_app)
+                self._cache_version += 1
                 messagebox.showinfo("Success", f"Patient '{name}' and appointment added successfully.", parent=window)
                 window.destroy()
                 self.show_records()
@@ -406,11 +816,17 @@ class DentistryClinicApp(tk.Tk):
         patient_treatment_entry.grid(row=2, column=1, padx=5, pady=5)
 
         tk.Label(patient_frame, text="Teeth Location", bg="#f4f6f8").grid(row=3, column=0, sticky="e", padx=5, pady=5)
+        teeth_bits_var = tk.IntVar(value=0)
         teeth_var = tk.StringVar()
         teeth_entry = tk.Entry(patient_frame, textvariable=teeth_var, state="readonly")
         teeth_entry.grid(row=3, column=1, padx=5, pady=5)
+
+        def set_teeth(bits: int) -> None:
+            teeth_bits_var.set(bits)
+            teeth_var.set(bits_to_teeth(bits))
+
         tk.Button(patient_frame, text="Select Teeth",
-                  command=lambda: self.open_teeth_selector(window, teeth_var.get(), lambda selection: teeth_var.set(selection))
+                  command=lambda: self.open_teeth_selector(window, teeth_bits_var.get(), set_teeth)
                  ).grid(row=3, column=2, padx=5, pady=5)
 
         # Appointment Info Frame
@@ -462,6 +878,7 @@ class DentistryClinicApp(tk.Tk):
                 if not messagebox.askyesno("Confirm Deletion", f"Are you sure you want to delete patient '{patient.patient_name}'?", parent=self):
                     return
                 session.delete(patient)
+            self._cache_version += 1
             messagebox.showinfo("Deleted", f"Patient with phone '{phone}' deleted.", parent=self)
             self.show_records()
         except Exception as e:
@@ -499,11 +916,17 @@ class DentistryClinicApp(tk.Tk):
                 treatment_entry.grid(row=1, column=1, padx=10, pady=5, sticky="w")
 
                 ttk.Label(mod_window, text="Teeth Location").grid(row=2, column=0, padx=10, pady=5, sticky="e")
-                teeth_var = tk.StringVar(value=patient.teeth_location if patient.teeth_location else "")
+                teeth_bits_var = tk.IntVar(value=patient.teeth_bits or 0)
+                teeth_var = tk.StringVar(value=bits_to_teeth(patient.teeth_bits) if patient.teeth_bits else "")
                 teeth_entry = tk.Entry(mod_window, textvariable=teeth_var, state="readonly")
                 teeth_entry.grid(row=2, column=1, padx=10, pady=5, sticky="w")
+
+                def set_teeth(bits: int) -> None:
+                    teeth_bits_var.set(bits)
+                    teeth_var.set(bits_to_teeth(bits))
+
                 ttk.Button(mod_window, text="Select Teeth",
-                           command=lambda: self.open_teeth_selector(mod_window, teeth_var.get(), lambda selection: teeth_var.set(selection))
+                           command=lambda: self.open_teeth_selector(mod_window, teeth_bits_var.get(), set_teeth)
                           ).grid(row=2, column=2, padx=10, pady=5)
 
                 def save_modifications() -> None:
@@ -511,9 +934,24 @@ class DentistryClinicApp(tk.Tk):
                         new_name = name_entry.get().strip()
                         if not new_name:
                             raise ValueError("Patient name cannot be empty.")
-                        patient.patient_name = new_name
-                        patient.treatment_type = treatment_entry.get().strip()
-                        patient.teeth_location = teeth_var.get()
+                        # A single Core UPDATE skips ORM instrumentation and
+                        # the re-fetch of the patient row; RETURNING supplies
+                        # the id for the manual FTS reindex.
+                        with session_scope() as session:
+                            updated_ids = session.execute(
+                                update(Patient)
+                                .where(Patient.phone_number == phone)
+                                .values(
+                                    patient_name=new_name,
+                                    treatment_type=treatment_entry.get().strip(),
+                                    teeth_bits=teeth_bits_var.get(),
+                                )
+                                .returning(Patient.id)
+                            ).scalars().all()
+                            if not updated_ids:
+                                raise ValueError("Patient not found.")
+                            _reindex_patient_fts(session.connection(), updated_ids)
+                        self._cache_version += 1
                         messagebox.showinfo("Success", "Patient details updated.", parent=mod_window)
                         mod_window.destroy()
                         self.show_records()
@@ -528,33 +966,40 @@ class DentistryClinicApp(tk.Tk):
 
     def appointment_reminders_gui(self) -> None:
         """Displays appointment reminders for today's appointments."""
-        try:
+
+        def fetch_reminders() -> str:
             today_date = date.today()
             with session_scope() as session:
-                apps_due = (
-                    session.query(Appointment)
-                    .options(joinedload(Appointment.patient))
-                    .filter(Appointment.appointment_date == today_date)
-                    .all()
-                )
+                apps_due = session.execute(TODAY_APPTS_STMT, {'d': today_date}).scalars().all()
                 if not apps_due:
-                    reminders = "✅ No appointments scheduled for today."
-                else:
-                    reminders_list = []
-                    for app in apps_due:
-                        reminders_list.append(
-                            f"⚠ {app.patient.patient_name} has an appointment for {app.treatment_type} with Dr. {app.dentist} today ({app.appointment_date.strftime('%Y-%m-%d')})."
-                        )
-                    reminders = "\n".join(reminders_list)
+                    return "✅ No appointments scheduled for today."
+                reminders_list = []
+                for app in apps_due:
+                    reminders_list.append(
+                        f"⚠ {app.patient.patient_name} has an appointment for {app.treatment_type} with Dr. {app.dentist} today ({app.appointment_date.strftime('%Y-%m-%d')})."
+                    )
+                return "\n".join(reminders_list)
+
+        def show(reminders: str) -> None:
             messagebox.showinfo("Appointment Reminders", reminders, parent=self)
-        except Exception as e:
-            logging.exception("Error retrieving appointment reminders")
-            messagebox.showerror("Error", f"Failed to retrieve reminders: {e}", parent=self)
+
+        def show_error(exc: Exception) -> None:
+            messagebox.showerror("Error", f"Failed to retrieve reminders: {exc}", parent=self)
+
+        self._submit_db_job(fetch_reminders, show, on_error=show_error)
+
+    def _on_search_key(self, event=None) -> None:
+        """Debounces search keystrokes: reschedules the query on each key."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(250, self.search_records)
 
     def search_records(self) -> None:
         """Searches records based on user input in the search entry."""
-        query = self.search_entry.get().strip()
-        self.show_records(query=query)
+        self._search_after_id = None
+        query = self.search_entry.get().strip() or None
+        if query != self._active_query:
+            self.show_records(query=query)
 
 # ------------------------
 # Main Execution